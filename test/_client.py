@@ -0,0 +1,42 @@
+import orjson
+
+API_URL = "http://localhost:8001"
+API_KEY = "2a993486e7a448474de66bfaea4adba7a99784defbcaba420e7f906176b94df6"
+
+HEADERS = {
+    "x-api-key": API_KEY,
+    "Content-Type": "application/json"
+}
+
+# One pool per process, built on first use so sync scripts never pull in
+# httpx and async scripts never pull in requests
+_session = None
+_async_client = None
+
+def get_session():
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _session = requests.Session()
+        _session.headers.update(HEADERS)
+        _session.mount("http://", HTTPAdapter(pool_maxsize=32))
+    return _session
+
+def get_async_client():
+    # The caller owns the client's lifetime; rebuild if it has been closed
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        import httpx
+
+        _async_client = httpx.AsyncClient(
+            base_url=API_URL,
+            headers=HEADERS,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=16),
+        )
+    return _async_client
+
+def post(path, payload, **kw):
+    return get_session().post(f"{API_URL}{path}", data=orjson.dumps(payload), **kw)
@@ -1,9 +1,10 @@
-import urllib.request
-import json
+import asyncio
+import msgspec
+import orjson
 import sys
 
-BASE_URL = "http://localhost:8001/v1"
-API_KEY = "2a993486e7a448474de66bfaea4adba7a99784defbcaba420e7f906176b94df6"
+from _client import get_async_client
+from schemas import QUERY_RESULT_DECODER
 
 QUERY = """
 SELECT TOP (10) [id]
@@ -17,56 +18,71 @@ SELECT TOP (10) [id]
   FROM [extend_db_ptrj].[dbo].[daftar_upah_aggregation_history]
 """
 
-def make_request(endpoint, method="GET", payload=None):
-    url = f"{BASE_URL}{endpoint}"
-    headers = {
-        "Content-Type": "application/json",
-        "x-api-key": API_KEY
-    }
-    
-    data = None
-    if payload:
-        data = json.dumps(payload).encode('utf-8')
-        
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+# We omit 'database' param to rely on fully qualified name in SQL.
+# The body never changes, so serialize it once.
+QUERY_BODY = orjson.dumps({"sql": QUERY})
+
+def _handle_str(dynamic_data):
+    # Only the leading characters matter; avoid copying the whole blob
+    head = dynamic_data[:16].lstrip()
+    if head.startswith(('{', '[')):
+        print("\n[CONFIRMED] 'dynamic_premi_data' is a JSON STRING. Needs parsing.")
+    else:
+        print("\n[INFO] 'dynamic_premi_data' is a string but might not be JSON.")
+
+def _handle_dict(dynamic_data):
+    print("\n[INFO] 'dynamic_premi_data' is already a DICT.")
+
+def _handle_other(dynamic_data):
+    pass
+
+# Classify by exact type with one dict lookup instead of an isinstance chain
+DYNAMIC_DATA_HANDLERS = {
+    str: _handle_str,
+    dict: _handle_dict,
+}
+
+async def make_request(client, endpoint, method="GET", payload=None, data_bytes=None):
+    data = data_bytes
+    if data is None and payload:
+        data = orjson.dumps(payload)
     
     try:
-        with urllib.request.urlopen(req) as response:
-            body = response.read().decode('utf-8')
-            return response.status, body
-    except urllib.error.HTTPError as e:
-        return e.code, e.read().decode('utf-8')
+        response = await client.request(method, endpoint, content=data)
+        # Raw bytes: the decoder parses them directly, no UTF-8 decode pass
+        return response.status_code, response.content
     except Exception as e:
-        return 0, str(e)
+        return 0, str(e).encode('utf-8')
 
-def run_test():
+async def run_test():
+    # Both calls are independent, so issue them concurrently on one client.
+    # This script owns the shared client and closes it once both are done.
+    async with get_async_client() as client:
+        (db_status, db_body), (status, body) = await asyncio.gather(
+            make_request(client, "/v1/databases"),
+            make_request(client, "/v1/query", "POST", data_bytes=QUERY_BODY),
+        )
+    
     # 1. List Databases
     print("--- Listing Databases ---")
-    status, body = make_request("/databases")
-    print(f"Status: {status}")
-    if status == 200:
+    print(f"Status: {db_status}")
+    if db_status == 200:
         try:
-            res = json.loads(body)
-            print("Databases:", json.dumps(res.get("data", {}).get("databases", []), indent=2))
+            res = QUERY_RESULT_DECODER.decode(db_body)
+            print("Databases:", orjson.dumps(res.data.get("databases", []), option=orjson.OPT_INDENT_2).decode())
         except:
             print("Failed to parse DB list response")
     else:
-        print("Error listing databases:", body)
+        print("Error listing databases:", db_body.decode('utf-8', 'replace'))
 
     # 2. Run Query
     print("\n--- Running Query ---")
-    # We omit 'database' param to rely on fully qualified name in SQL
-    payload = {
-        "sql": QUERY
-    }
-    
-    status, body = make_request("/query", "POST", payload)
     print(f"Status: {status}")
     
     try:
-        res_json = json.loads(body)
-        if res_json.get("success"):
-            data_rows = res_json.get("data", {}).get("recordset", [])
+        res = QUERY_RESULT_DECODER.decode(body)
+        if res.success:
+            data_rows = res.data.get("recordset", [])
             print(f"Number of rows: {len(data_rows)}")
             
             if len(data_rows) > 0:
@@ -75,23 +91,28 @@ def run_test():
                 print(f"\nType of 'dynamic_premi_data': {type(dynamic_data)}")
                 print(f"Value of 'dynamic_premi_data': {dynamic_data}")
                 
-                if isinstance(dynamic_data, str):
-                    if dynamic_data.strip().startswith('{') or dynamic_data.strip().startswith('['):
-                        print("\n[CONFIRMED] 'dynamic_premi_data' is a JSON STRING. Needs parsing.")
-                    else:
-                        print("\n[INFO] 'dynamic_premi_data' is a string but might not be JSON.")
-                elif isinstance(dynamic_data, dict):
-                    print("\n[INFO] 'dynamic_premi_data' is already a DICT.")
+                DYNAMIC_DATA_HANDLERS.get(type(dynamic_data), _handle_other)(dynamic_data)
         else:
             print("Query failed in backend.")
-            print(f"Error: {res_json.get('error')}")
+            print(f"Error: {res.error}")
             # If error mentions specific syntax, print it
-            if "Incorrect syntax" in res_json.get('error', ''):
+            if "Incorrect syntax" in (res.error or ''):
                  print("Hint: Check if the database name in the query is correct.")
 
-    except json.JSONDecodeError:
+    except msgspec.DecodeError:
         print("Response is not JSON")
-        print(body)
+        print(body.decode('utf-8', 'replace'))
 
 if __name__ == "__main__":
-    run_test()
+    # uvloop has no Windows build; use the selector loop there instead.
+    # Elsewhere it is optional and the plain asyncio loop works fine.
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.install()
+    asyncio.run(run_test())
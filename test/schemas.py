@@ -0,0 +1,14 @@
+from typing import Optional
+
+import msgspec
+
+# Mirrors standardResponseSchema in src/routes/query.ts
+class QueryResult(msgspec.Struct):
+    # Defaulted so non-envelope bodies (e.g. Fastify's own 400/404) land in the failure branch
+    success: bool = False
+    error: Optional[str] = None
+    data: Optional[dict] = None
+    execution_ms: float = 0
+
+# Build once and reuse - constructing a Decoder per call throws away its speed
+QUERY_RESULT_DECODER = msgspec.json.Decoder(QueryResult)